@@ -0,0 +1,20 @@
+-- Asana-like simulation schema: secondary indexes.
+-- Applied by finalize_schema after every generator has run, so the bulk load
+-- does not pay for B-tree maintenance on each insert.
+
+-- Indexes are chosen to mirror common query patterns in Asana-like tools.
+
+-- Users often filter by team/project and completion state.
+CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_assignee ON tasks(assignee_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed_at ON tasks(completed_at);
+
+-- Subtasks commonly accessed via parent.
+CREATE INDEX IF NOT EXISTS idx_subtasks_parent ON subtasks(parent_task_id);
+
+-- Comments frequently queried by task/subtask.
+CREATE INDEX IF NOT EXISTS idx_comments_task ON comments(task_id);
+CREATE INDEX IF NOT EXISTS idx_comments_subtask ON comments(subtask_id);
+
+
@@ -5,8 +5,8 @@
 -- - Use UUIDs (TEXT) as primary keys to resemble API IDs
 -- - Capture lifecycle timestamps (created_at, completed_at, due_date, last_activity_at)
 -- - Enforce referential integrity using foreign keys
-
-PRAGMA foreign_keys = ON;
+--
+-- Indexes live in schema_indexes.sql and are built after the bulk load.
 
 -- ORGANIZATIONS
 -- A single large company using Asana. Kept generic so we can extend to multi-org later.
@@ -146,20 +146,3 @@ CREATE TABLE IF NOT EXISTS comments (
     FOREIGN KEY (subtask_id) REFERENCES subtasks(id) ON DELETE CASCADE,
     FOREIGN KEY (author_id) REFERENCES users(id) ON DELETE SET NULL
 );
-
--- Indexes chosen to mirror common query patterns in Asana-like tools.
-
--- Users often filter by team/project and completion state.
-CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id);
-CREATE INDEX IF NOT EXISTS idx_tasks_assignee ON tasks(assignee_id);
-CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date);
-CREATE INDEX IF NOT EXISTS idx_tasks_completed_at ON tasks(completed_at);
-
--- Subtasks commonly accessed via parent.
-CREATE INDEX IF NOT EXISTS idx_subtasks_parent ON subtasks(parent_task_id);
-
--- Comments frequently queried by task/subtask.
-CREATE INDEX IF NOT EXISTS idx_comments_task ON comments(task_id);
-CREATE INDEX IF NOT EXISTS idx_comments_subtask ON comments(subtask_id);
-
-
@@ -7,89 +7,100 @@ collaboration patterns.
 
 from __future__ import annotations
 
-import random
-import uuid
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from faker import Faker
 
 from ..utils.config import VOLUME_CONFIG
-from ..utils.dates import random_datetime_between
-from ..utils.db import bulk_insert
-from ..utils.text import generate_comment
+from ..utils.dates import random_datetimes_between, utc_now
+from ..utils.db import bulk_insert, transaction
+from ..utils.ids import new_ids
+from ..utils.rng import RNG
+from ..utils.text import generate_comment_bodies, get_faker
+from .tasks import TaskTable
+from .users import UserTable
 
 
 def generate_comments(
     conn,
-    tasks: List[Dict[str, str]],
-    users: List[Dict[str, str]],
+    tasks: TaskTable,
+    users: UserTable,
     faker: Optional[Faker] = None,
 ) -> List[Dict[str, str]]:
     """
     Attach comments to ~20% of tasks, 1–5 comments per task.
     """
-    faker = faker or Faker("en_US")
+    faker = faker or get_faker()
 
     if not tasks:
         return []
 
     commented_fraction = VOLUME_CONFIG.commented_task_fraction
     num_tasks_with_comments = int(len(tasks) * commented_fraction)
-    tasks_with_comments = random.sample(tasks, k=max(1, num_tasks_with_comments))
+    commented_idx = RNG.sample(range(len(tasks)), k=max(1, num_tasks_with_comments))
 
     rows = []
     comments: List[Dict[str, str]] = []
+    task_updates: List[Tuple[str, str]] = []
 
-    for task in tasks_with_comments:
-        created_at = datetime.fromisoformat(task["created_at"])
-        end = (
-            datetime.fromisoformat(task["completed_at"])
-            if task["completed_at"]
-            else datetime.utcnow()
-        )
+    # Draw per-task counts up front so all comment IDs come from one batch.
+    counts = [RNG.randint(1, 5) for _ in commented_idx]
+    comment_ids = iter(new_ids("comment", sum(counts)))
+    author_ids = iter(RNG.choices(users.ids, k=sum(counts)))
+    bodies = iter(generate_comment_bodies(faker, sum(counts)))
+
+    # Bind hot callables to locals and read the clock once, not per task.
+    sample_thread = random_datetimes_between
+    now = utc_now()
 
-        comment_count = random.randint(1, 5)
-        last_comment_time = created_at
+    for i_task, comment_count in zip(commented_idx, counts):
+        task_id = tasks.ids[i_task]
+        created_at = tasks.created[i_task]
+        end = tasks.completed[i_task] or now
 
-        for _ in range(comment_count):
-            comment_id = str(uuid.uuid4())
-            author = random.choice(users)
-            ts = random_datetime_between(last_comment_time, end)
-            last_comment_time = ts
+        # Timestamps come back sorted, so the thread reads in order and the
+        # final one is the task's most recent activity.
+        for ts in sample_thread(created_at, end, comment_count):
+            comment_id = next(comment_ids)
+            author_id = next(author_ids)
+            last_comment_iso = ts.isoformat()
 
-            body = generate_comment(faker)
+            body = next(bodies)
 
             rows.append(
                 (
                     comment_id,
-                    task["id"],
+                    task_id,
                     None,  # subtask_id
-                    author["id"],
+                    author_id,
                     body,
-                    ts.isoformat(),
+                    last_comment_iso,
                 )
             )
             comments.append(
                 {
                     "id": comment_id,
-                    "task_id": task["id"],
+                    "task_id": task_id,
                 }
             )
 
-        # Update last_activity_at on the task to reflect most recent comment.
-        conn.execute(
+        # last_activity_at on the task should reflect the most recent comment.
+        task_updates.append((last_comment_iso, task_id))
+
+    # Comment rows and the task activity bumps land in one explicit
+    # transaction so the load pays for a single commit.
+    with transaction(conn):
+        bulk_insert(
+            conn,
+            table="comments",
+            columns=["id", "task_id", "subtask_id", "author_id", "body", "created_at"],
+            rows=rows,
+        )
+        conn.executemany(
             "UPDATE tasks SET last_activity_at = MAX(last_activity_at, ?) WHERE id = ?",
-            (last_comment_time.isoformat(), task["id"]),
+            task_updates,
         )
 
-    bulk_insert(
-        conn,
-        table="comments",
-        columns=["id", "task_id", "subtask_id", "author_id", "body", "created_at"],
-        rows=rows,
-    )
-
     return comments
 
 
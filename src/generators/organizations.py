@@ -7,14 +7,16 @@ generate only one. Returning IDs keeps downstream generators decoupled.
 
 from __future__ import annotations
 
-import uuid
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Dict, Optional
 
 from faker import Faker
 
 from ..utils.config import ORG_CONFIG
+from ..utils.dates import utc_now
 from ..utils.db import bulk_insert
+from ..utils.ids import new_ids
+from ..utils.rng import RNG
 
 
 def generate_organization(conn, faker: Optional[Faker] = None) -> Dict[str, str]:
@@ -24,11 +26,9 @@ def generate_organization(conn, faker: Optional[Faker] = None) -> Dict[str, str]
     We place the org creation 8–15 years in the past to reflect a mature
     enterprise that has grown to thousands of users.
     """
-    faker = faker or Faker("en_US")
-
-    org_id = str(uuid.uuid4())
-    years_ago = faker.random_int(min=8, max=15)
-    created_at = datetime.utcnow() - timedelta(days=365 * years_ago)
+    org_id = new_ids("organization", 1)[0]
+    years_ago = RNG.randint(8, 15)
+    created_at = utc_now() - timedelta(days=365 * years_ago)
 
     rows = [
         (
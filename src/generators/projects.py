@@ -7,15 +7,19 @@ Creates multiple projects per team with realistic naming and type mix
 
 from __future__ import annotations
 
-import random
-import uuid
-from datetime import datetime, timedelta
+from datetime import timedelta
+from itertools import accumulate
 from typing import Dict, List, Optional
 
 from faker import Faker
 
 from ..utils.config import VOLUME_CONFIG
+from ..utils.dates import utc_now
 from ..utils.db import bulk_insert
+from ..utils.ids import new_ids
+from ..utils.rng import RNG
+from ..utils.text import generate_launch_feature, generate_project_description
+from .teams import TeamTable
 
 
 PROJECT_TYPES = [
@@ -26,12 +30,15 @@ PROJECT_TYPES = [
 ]
 
 
+_PROJECT_TYPE_LABELS = tuple(label for label, _ in PROJECT_TYPES)
+_PROJECT_TYPE_CUM_WEIGHTS = tuple(accumulate(weight for _, weight in PROJECT_TYPES))
+
+
 def _pick_project_type() -> str:
-    labels, weights = zip(*PROJECT_TYPES)
-    return random.choices(labels, weights=weights, k=1)[0]
+    return RNG.choices(_PROJECT_TYPE_LABELS, cum_weights=_PROJECT_TYPE_CUM_WEIGHTS, k=1)[0]
 
 
-def _name_project(faker: Faker, ptype: str, team_name: str) -> str:
+def _name_project(ptype: str, team_name: str) -> str:
     """
     Generate human-like project names with light templating.
 
@@ -41,26 +48,26 @@ def _name_project(faker: Faker, ptype: str, team_name: str) -> str:
     - Ops use stability/maintenance phrasing.
     """
     if ptype == "roadmap":
-        quarter = random.choice(["Q1", "Q2", "Q3", "Q4"])
-        year = datetime.utcnow().year + random.choice([0, 1])
+        quarter = RNG.choice(["Q1", "Q2", "Q3", "Q4"])
+        year = utc_now().year + RNG.choice([0, 1])
         return f"{team_name} {quarter} {year} Roadmap"
     if ptype == "sprint":
-        sprint_num = random.randint(12, 58)
-        codename = random.choice(["Orion", "Nova", "Atlas", "Vega", "Helix", "Quasar"])
+        sprint_num = RNG.randint(12, 58)
+        codename = RNG.choice(["Orion", "Nova", "Atlas", "Vega", "Helix", "Quasar"])
         return f"Sprint {sprint_num} - {codename}"
     if ptype == "launch":
-        feature = faker.bs().title()
-        market = random.choice(["Enterprise", "SMB", "EMEA", "US", "APAC"])
+        feature = generate_launch_feature()
+        market = RNG.choice(["Enterprise", "SMB", "EMEA", "US", "APAC"])
         return f"{feature} Launch - {market}"
     # ops
-    theme = random.choice(["Reliability", "SRE", "Incident Readiness", "Data Hygiene", "Automation"])
+    theme = RNG.choice(["Reliability", "SRE", "Incident Readiness", "Data Hygiene", "Automation"])
     return f"{team_name} {theme} Ops"
 
 
 def generate_projects(
     conn,
     organization_id: str,
-    teams: List[Dict[str, str]],
+    teams: TeamTable,
     faker: Optional[Faker] = None,
 ) -> List[Dict[str, str]]:
     """
@@ -68,39 +75,40 @@ def generate_projects(
 
     Creation dates trail team creation to reflect team ramp-up.
     """
-    faker = faker or Faker("en_US")
-
     min_p, max_p = VOLUME_CONFIG.min_projects_per_team, VOLUME_CONFIG.max_projects_per_team
     projects: List[Dict[str, str]] = []
     rows = []
 
-    for team in teams:
-        count = int(round(random.triangular(min_p, max_p, (min_p + max_p) / 2 + 1)))
-        count = max(min_p, min(max_p, count))
-
-        team_created = datetime.fromisoformat(team["created_at"])
+    # Draw every team's project count up front so IDs come from one batch.
+    mode = (min_p + max_p) / 2 + 1
+    project_counts = [
+        max(min_p, min(max_p, int(round(RNG.triangular(min_p, max_p, mode)))))
+        for _ in range(len(teams))
+    ]
+    project_ids = iter(new_ids("project", sum(project_counts)))
 
+    for team_id, team_name, team_created, count in zip(teams.ids, teams.names, teams.created, project_counts):
         for _ in range(count):
             ptype = _pick_project_type()
-            name = _name_project(faker, ptype, team["name"])
-            project_id = str(uuid.uuid4())
+            name = _name_project(ptype, team_name)
+            project_id = next(project_ids)
 
             # Start after team creation; allow some projects to be newer.
-            days_after_team = random.randint(30, 900)
+            days_after_team = RNG.randint(30, 900)
             created_at = team_created + timedelta(days=days_after_team)
 
             # Roadmaps and launches tend to have due dates; ops may not.
             due_date = None
             if ptype in {"roadmap", "launch"}:
-                due_date = (created_at + timedelta(days=random.randint(60, 240))).date().isoformat()
+                due_date = (created_at + timedelta(days=RNG.randint(60, 240))).date().isoformat()
 
             rows.append(
                 (
                     project_id,
-                    team["id"],
+                    team_id,
                     organization_id,
                     name,
-                    faker.sentence(nb_words=10),
+                    generate_project_description(ptype, team_name),
                     ptype,
                     created_at.date().isoformat(),
                     due_date,
@@ -112,10 +120,12 @@ def generate_projects(
             projects.append(
                 {
                     "id": project_id,
-                    "team_id": team["id"],
+                    "team_id": team_id,
                     "name": name,
                     "type": ptype,
                     "created_at": created_at.isoformat(),
+                    # Parsed value for downstream generators; not a column.
+                    "_created_dt": created_at,
                 }
             )
 
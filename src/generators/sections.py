@@ -7,14 +7,15 @@ same sections to reflect team-specific workflows.
 
 from __future__ import annotations
 
-import random
-import uuid
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Dict, List, Optional
 
 from faker import Faker
 
 from ..utils.db import bulk_insert
+from ..utils.ids import new_ids
+from ..utils.rng import RNG
+from ..utils.text import get_faker
 
 
 SECTION_TEMPLATES = [
@@ -37,24 +38,24 @@ def generate_sections(
     Some projects (e.g., ops) may have leaner boards; we randomly drop one
     middle column in a minority of cases to reflect bespoke workflows.
     """
-    faker = faker or Faker("en_US")
+    faker = faker or get_faker()
 
     rows = []
     sections: List[Dict[str, str]] = []
 
     for project in projects:
-        template = random.choice(SECTION_TEMPLATES)
+        template = RNG.choice(SECTION_TEMPLATES)
 
         # For ops-type projects, occasionally shorten the workflow.
         names = list(template)
-        if project["type"] == "ops" and len(names) > 4 and random.random() < 0.4:
-            drop_idx = random.randint(1, len(names) - 2)  # drop a middle stage
+        if project["type"] == "ops" and len(names) > 4 and RNG.random() < 0.4:
+            drop_idx = RNG.randint(1, len(names) - 2)  # drop a middle stage
             names.pop(drop_idx)
 
-        created_at = datetime.fromisoformat(project["created_at"])
-        for order, name in enumerate(names):
-            section_id = str(uuid.uuid4())
-            section_created = created_at + timedelta(days=random.randint(0, 60))
+        created_at = project["_created_dt"]
+        section_ids = new_ids("section", len(names))
+        for order, (name, section_id) in enumerate(zip(names, section_ids)):
+            section_created = created_at + timedelta(days=RNG.randint(0, 60))
             rows.append(
                 (
                     section_id,
@@ -132,9 +132,6 @@ correlated to the parent task’s status.
 
 from __future__ import annotations
 
-import random
-import uuid
-from datetime import datetime
 from typing import Dict, List, Optional
 
 from faker import Faker
@@ -143,103 +140,106 @@ from ..utils.config import VOLUME_CONFIG
 from ..utils.dates import (
     business_due_date_from_created,
     completed_after_created,
-    random_datetime_between,
+    random_datetimes_between,
+    utc_now,
 )
 from ..utils.db import bulk_insert
-from ..utils.text import generate_subtask_title
+from ..utils.ids import new_ids
+from ..utils.rng import RNG
+from ..utils.text import generate_subtask_titles, get_faker
+from .tasks import TaskTable
 
 
 def generate_subtasks(
     conn,
     organization_id: str,
-    tasks: List[Dict[str, str]],
+    tasks: TaskTable,
     faker: Optional[Faker] = None,
 ) -> List[Dict[str, str]]:
     """
     Generate subtasks for 30–40% of tasks, 2–6 subtasks each.
     Ensures every subtask has a creator (created_by_user_id).
     """
-    faker = faker or Faker("en_US")
+    faker = faker or get_faker()
 
     if not tasks:
         return []
 
     min_frac = VOLUME_CONFIG.min_subtask_task_fraction
     max_frac = VOLUME_CONFIG.max_subtask_task_fraction
-    target_frac = random.uniform(min_frac, max_frac)
+    target_frac = RNG.uniform(min_frac, max_frac)
     num_parents = int(len(tasks) * target_frac)
-    parent_tasks = random.sample(tasks, k=max(1, num_parents))
+    parent_idx = RNG.sample(range(len(tasks)), k=max(1, num_parents))
 
     subtasks: List[Dict[str, str]] = []
     rows = []
-    now = datetime.utcnow()
+    now = utc_now()
+
+    # Bind hot callables to locals; the inner loop runs once per subtask.
+    rand = RNG.random
+    choice = RNG.choice
+    due_from_created = business_due_date_from_created
+    completed_after = completed_after_created
 
     # Collect possible creators from tasks (any assigned user)
-    possible_creators = [
-        t["assignee_id"] for t in tasks if t.get("assignee_id")
-    ]
-
-    for parent in parent_tasks:
-        parent_created = datetime.fromisoformat(parent["created_at"])
-        parent_completed = (
-            datetime.fromisoformat(parent["completed_at"])
-            if parent["completed_at"]
-            else None
-        )
-        parent_due = (
-            datetime.fromisoformat(parent["due_date"]).date()
-            if parent["due_date"]
-            else None
-        )
+    possible_creators = [a for a in tasks.assignee_ids if a]
+
+    # Draw per-parent counts up front so all subtask IDs come from one batch.
+    counts = [RNG.randint(2, 6) for _ in parent_idx]
+    sub_ids = iter(new_ids("subtask", sum(counts)))
+    titles = iter(generate_subtask_titles(["(hidden)"] * sum(counts)))
+
+    for i_parent, count in zip(parent_idx, counts):
+        parent_id = tasks.ids[i_parent]
+        project_id = tasks.project_ids[i_parent]
+        parent_assignee_id = tasks.assignee_ids[i_parent]
+        parent_created = tasks.created[i_parent]
+        parent_completed = tasks.completed[i_parent]
+        parent_due = tasks.due[i_parent]
+        # Correlate completion with parent completion.
+        completed_prob = 0.9 if parent_completed else 0.3
 
-        count = random.randint(2, 6)
         base_sort = 0
 
-        for i in range(count):
-            sub_id = str(uuid.uuid4())
-            created_at = random_datetime_between(
-                parent_created, parent_completed or now
-            )
+        created_times = random_datetimes_between(
+            parent_created, parent_completed or now, count
+        )
+
+        for i, created_at in enumerate(created_times):
+            sub_id = next(sub_ids)
 
             # Subtasks often share the parent due date or slightly earlier.
-            if parent_due and random.random() < 0.8:
+            if parent_due and rand() < 0.8:
                 due_date = parent_due
             else:
-                due_date = business_due_date_from_created(
+                due_date = due_from_created(
                     created_at, min_days=1, max_days=30
                 )
 
-            # Correlate completion with parent completion.
             completed_at = None
-            if parent_completed:
-                if random.random() < 0.9:
-                    completed_at = completed_after_created(
-                        created_at, due_date, min_hours=1, max_days=30
-                    )
-            else:
-                if random.random() < 0.3:
-                    completed_at = completed_after_created(
-                        created_at, due_date, min_hours=1, max_days=30
-                    )
+            if rand() < completed_prob:
+                completed_at = completed_after(
+                    created_at, due_date, min_hours=1, max_days=30
+                )
 
             # Creator: always required
-            if parent.get("assignee_id"):
-                created_by_user_id = parent["assignee_id"]
+            if parent_assignee_id:
+                created_by_user_id = parent_assignee_id
             else:
-                created_by_user_id = random.choice(possible_creators)
+                created_by_user_id = choice(possible_creators)
 
             # Assignee: may be None to mimic delegation
-            assignee_id = parent.get("assignee_id")
-            if assignee_id and random.random() < 0.15:
+            assignee_id = parent_assignee_id
+            if assignee_id and rand() < 0.15:
                 assignee_id = None
 
-            title = generate_subtask_title(parent_title="(hidden)")
+            title = next(titles)
 
             rows.append(
                 (
                     sub_id,
-                    parent["id"],
-                    parent["project_id"],
+                    parent_id,
+                    project_id,
                     organization_id,
                     title,
                     None,
@@ -255,8 +255,8 @@ def generate_subtasks(
             subtasks.append(
                 {
                     "id": sub_id,
-                    "parent_task_id": parent["id"],
-                    "project_id": parent["project_id"],
+                    "parent_task_id": parent_id,
+                    "project_id": project_id,
                 }
             )
 
@@ -278,6 +278,7 @@ def generate_subtasks(
             "sort_order",
         ],
         rows=rows,
+        multi_row_batch=100,
     )
 
     return subtasks
@@ -10,25 +10,67 @@ Creates tens of thousands of tasks across projects with:
 
 from __future__ import annotations
 
-import random
-import uuid
-from datetime import datetime
-from typing import Dict, List, Optional
+import bisect
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from faker import Faker
 
-from ..utils.config import TASK_CONFIG, VOLUME_CONFIG
-from ..utils.dates import business_due_date_from_created, completed_after_created, is_overdue, random_datetime_between
+from ..utils.config import PARALLEL_CONFIG, TASK_CONFIG, VOLUME_CONFIG
+from ..utils.dates import business_due_date_from_created, completed_after_created, is_overdue, random_datetime_between, utc_now
 from ..utils.db import bulk_insert
-from ..utils.text import generate_task_title
+from ..utils.ids import new_ids
+from ..utils.rng import RNG
+from ..utils.text import generate_task_titles
+from .team_memberships import MembershipTable
+from .users import UserTable
 
 
-def _build_team_members(projects: List[Dict[str, str]], memberships: List[Dict[str, str]]) -> Dict[str, List[str]]:
-    """Map team_id -> list of user_ids for assignment decisions."""
-    team_to_users: Dict[str, List[str]] = {}
-    for m in memberships:
-        team_to_users.setdefault(m["team_id"], []).append(m["user_id"])
-    return team_to_users
+PRIORITIES = ("low", "medium", "high", "urgent")
+DUE_DATE_PROJECT_TYPES = frozenset({"roadmap", "sprint", "launch"})
+
+
+@dataclass
+class TaskTable:
+    """
+    Column-oriented task records handed to the subtask and comment generators.
+
+    Parallel lists instead of one dict per task: downstream code only reads a
+    few fields, and tens of thousands of small dicts dominate memory. Index i
+    across every list describes the same task.
+    """
+
+    ids: List[str] = field(default_factory=list)
+    project_ids: List[str] = field(default_factory=list)
+    assignee_ids: List[Optional[str]] = field(default_factory=list)
+    created: List[datetime] = field(default_factory=list)
+    due: List[Optional[date]] = field(default_factory=list)
+    completed: List[Optional[datetime]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def extend(self, other: "TaskTable") -> None:
+        self.ids.extend(other.ids)
+        self.project_ids.extend(other.project_ids)
+        self.assignee_ids.extend(other.assignee_ids)
+        self.created.extend(other.created)
+        self.due.extend(other.due)
+        self.completed.extend(other.completed)
+
+
+def _build_team_members(
+    projects: List[Dict[str, str]], memberships: MembershipTable
+) -> Dict[str, Tuple[str, ...]]:
+    """Map team_id -> tuple of user_ids for assignment decisions."""
+    team_to_users: Dict[str, List[str]] = defaultdict(list)
+    for team_id, user_id in zip(memberships.team_ids, memberships.user_ids):
+        team_to_users[team_id].append(user_id)
+    return {team_id: tuple(user_ids) for team_id, user_ids in team_to_users.items()}
 
 
 def _sections_by_project(sections: List[Dict[str, str]]) -> Dict[str, List[Dict[str, str]]]:
@@ -38,147 +80,294 @@ def _sections_by_project(sections: List[Dict[str, str]]) -> Dict[str, List[Dict[
     return mapping
 
 
-def _pick_section(sections: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
+def _section_weight(section: Dict[str, str]) -> float:
     """
     Prefer "work-in-flight" sections over Done/Backlog.
 
     This creates more realistic board distributions where active columns
     carry more tasks than terminal columns.
     """
+    name = section["name"].lower()
+    if "backlog" in name or "ideas" in name:
+        return 0.8
+    if "done" in name or "closed" in name or "complete" in name:
+        return 0.7
+    return 2.0  # emphasize in-progress stages
+
+
+def _pick_section(
+    sections: List[Dict[str, str]],
+    cum_weights: List[float],
+) -> Optional[Dict[str, str]]:
+    """Weighted section pick against cumulative weights prepared per project."""
     if not sections:
         return None
-    weights = []
-    for s in sections:
-        name = s["name"].lower()
-        if "backlog" in name or "ideas" in name:
-            weights.append(0.8)
-        elif "done" in name or "closed" in name or "complete" in name:
-            weights.append(0.7)
-        else:
-            weights.append(2.0)  # emphasize in-progress stages
-    return random.choices(sections, weights=weights, k=1)[0]
+    x = RNG.random() * cum_weights[-1]
+    return sections[bisect.bisect(cum_weights, x, 0, len(sections) - 1)]
 
 
-def _pick_assignee(
+def _draw_assignees(
     project: Dict[str, str],
-    team_members: Dict[str, List[str]],
-    all_users: List[Dict[str, str]],
-) -> Optional[str]:
+    team_members: Dict[str, Tuple[str, ...]],
+    all_user_ids: Tuple[str, ...],
+    n: int,
+) -> List[Optional[str]]:
     """
     Assign from the project’s team when possible, with some unassigned tasks.
+
+    Draws the assignees for all `n` tasks of a project in one batch.
     """
-    if random.random() < TASK_CONFIG.unassigned_task_probability:
-        return None
+    # Fallback to any user if team membership data is sparse.
+    candidates = team_members.get(project["team_id"]) or all_user_ids
+    unassigned_p = TASK_CONFIG.unassigned_task_probability
+    return [
+        None if RNG.random() < unassigned_p else pick
+        for pick in RNG.choices(candidates, k=n)
+    ]
+
+
+def _draw_schedules(
+    project_created: datetime,
+    now: datetime,
+    n: int,
+    has_due: bool,
+) -> Tuple[List[datetime], List[Optional[date]], List[Optional[datetime]]]:
+    """
+    Draw created/due/completed values for all `n` tasks of a project at once.
+
+    The numeric decisions (due-date gates, completion flag, overdue push) are
+    made column by column so the row loop only formats and packages values.
+    """
+    rand = RNG.random
+    completion_ratio = TASK_CONFIG.completion_ratio
+    overdue_probability = TASK_CONFIG.overdue_task_probability
+    today = now.date()
+
+    created = [random_datetime_between(project_created, now) for _ in range(n)]
+
+    # Assign due dates more frequently for roadmap/sprint/launch work.
+    due: List[Optional[date]] = []
+    for created_at in created:
+        if has_due and rand() < 0.85:
+            due.append(business_due_date_from_created(created_at, min_days=3, max_days=75))
+        elif rand() < 0.35:
+            due.append(business_due_date_from_created(created_at, min_days=5, max_days=45))
+        else:
+            due.append(None)
 
-    team_id = project["team_id"]
-    candidates = team_members.get(team_id)
-    if not candidates:
-        # Fallback to any user if team membership data is sparse.
-        return random.choice(all_users)["id"]
-    return random.choice(candidates)
+    # Completion decisions: globally ~60–70% completed.
+    completed_mask = [rand() < completion_ratio for _ in range(n)]
+    completed = [
+        completed_after_created(created_at, due_date) if done else None
+        for created_at, due_date, done in zip(created, due, completed_mask)
+    ]
 
+    # Introduce a controlled fraction of overdue tasks: only some incomplete
+    # tasks are pushed, and only if their due date is not yet past.
+    for i, (due_date, done) in enumerate(zip(due, completed_mask)):
+        if due_date is not None and not done and rand() < overdue_probability and due_date >= today:
+            due[i] = today
 
-def generate_tasks(
-    conn,
+    return created, due, completed
+
+
+def _allocate_task_ids(projects: List[Dict[str, str]]) -> List[List[str]]:
+    """
+    Draw every project's task count and mint all task IDs in one batch.
+
+    Returns one ID list per project (its length is the task count). IDs are
+    minted here, in the parent process, so sequential IDs stay unique even
+    when projects are generated in worker processes.
+    """
+    min_t, max_t = VOLUME_CONFIG.min_tasks_per_project, VOLUME_CONFIG.max_tasks_per_project
+    mode = (min_t + max_t) / 2 + 10  # bias slightly higher than midpoint
+    task_counts = [
+        max(min_t, min(max_t, int(round(RNG.triangular(min_t, max_t, mode)))))
+        for _ in projects
+    ]
+    ids = new_ids("task", sum(task_counts))
+    per_project = []
+    offset = 0
+    for count in task_counts:
+        per_project.append(ids[offset:offset + count])
+        offset += count
+    return per_project
+
+
+def _iter_task_rows(
     organization_id: str,
     projects: List[Dict[str, str]],
-    sections: List[Dict[str, str]],
-    users: List[Dict[str, str]],
-    memberships: List[Dict[str, str]],
-    faker: Optional[Faker] = None,
-) -> List[Dict[str, str]]:
+    project_task_ids: List[List[str]],
+    proj_to_sections: Dict[str, List[Dict[str, str]]],
+    team_members: Dict[str, Tuple[str, ...]],
+    all_user_ids: Tuple[str, ...],
+    out: TaskTable,
+) -> Iterator[Tuple[object, ...]]:
     """
-    Create 40–120 tasks per project with corporate-like lifecycle patterns.
+    Yield task insert rows project by project, appending each task's
+    columns to `out` for downstream generators.
+
+    Streaming lets executemany consume rows while they are generated instead
+    of holding every insert tuple in memory at once.
     """
-    faker = faker or Faker("en_US")
+    now = utc_now()
+
+    # The task loop runs tens of thousands of times; bind hot callables to
+    # locals to skip repeated global/attribute lookups.
+    choice = RNG.choice
+    titles_for = generate_task_titles
+    add_id = out.ids.append
+    add_project_id = out.project_ids.append
+    add_assignee_id = out.assignee_ids.append
+    add_created = out.created.append
+    add_due = out.due.append
+    add_completed = out.completed.append
+
+    for project, task_ids in zip(projects, project_task_ids):
+        project_id = project["id"]
+        project_type = project["type"]
+        project_created = project["_created_dt"]
+
+        project_sections = proj_to_sections.get(project_id, [])
+        # Cumulative weights are built once per project; each task then costs
+        # a single bisect instead of a fresh random.choices setup.
+        section_cum = list(accumulate(_section_weight(s) for s in project_sections))
+
+        assignees = _draw_assignees(project, team_members, all_user_ids, len(task_ids))
+        created, due, completed = _draw_schedules(
+            project_created, now, len(task_ids), project_type in DUE_DATE_PROJECT_TYPES
+        )
+
+        task_sections = [_pick_section(project_sections, section_cum) for _ in task_ids]
+        names = titles_for(project_type, [s["name"] if s else None for s in task_sections])
+
+        for task_id, assignee_id, created_at, due_date, completed_at, section, name in zip(
+            task_ids, assignees, created, due, completed, task_sections, names
+        ):
+            section_id = section["id"] if section else None
 
-    proj_to_sections = _sections_by_project(sections)
-    team_members = _build_team_members(projects, memberships)
-    all_users = users
+            # Format each timestamp once; last_activity_at reuses them.
+            created_iso = created_at.isoformat()
+            due_iso = due_date.isoformat() if due_date else None
+            completed_iso = completed_at.isoformat() if completed_at else None
+            last_activity_iso = completed_iso or created_iso
+
+            add_id(task_id)
+            add_project_id(project_id)
+            add_assignee_id(assignee_id)
+            add_created(created_at)
+            add_due(due_date)
+            add_completed(completed_at)
+            yield (
+                task_id,
+                project_id,
+                section_id,
+                organization_id,
+                name,
+                None,  # description left for future extension
+                assignee_id,
+                assignee_id or choice(all_user_ids),  # created_by: mostly assignee or teammate
+                created_iso,
+                due_iso,
+                completed_iso,
+                last_activity_iso,
+                choice(PRIORITIES),
+                0,
+            )
 
-    tasks: List[Dict[str, str]] = []
-    rows = []
-    now = datetime.utcnow()
 
-    for project in projects:
-        min_t, max_t = VOLUME_CONFIG.min_tasks_per_project, VOLUME_CONFIG.max_tasks_per_project
-        mode = (min_t + max_t) / 2 + 10  # bias slightly higher than midpoint
-        num_tasks = int(round(random.triangular(min_t, max_t, mode)))
-        num_tasks = max(min_t, min(max_t, num_tasks))
+def _task_rows_for_projects(
+    seed: int,
+    organization_id: str,
+    projects: List[Dict[str, str]],
+    project_task_ids: List[List[str]],
+    proj_to_sections: Dict[str, List[Dict[str, str]]],
+    team_members: Dict[str, Tuple[str, ...]],
+    all_user_ids: Tuple[str, ...],
+) -> Tuple[List[Tuple[object, ...]], TaskTable]:
+    """
+    Worker entry point: build task rows for a chunk of projects.
 
-        project_created = datetime.fromisoformat(project["created_at"])
+    Each worker reseeds its RNGs from `seed`; forked processes would otherwise
+    inherit identical random state and emit duplicate streams.
+    """
+    RNG.seed(seed)
+    out = TaskTable()
+    rows = list(
+        _iter_task_rows(
+            organization_id, projects, project_task_ids, proj_to_sections, team_members, all_user_ids, out
+        )
+    )
+    return rows, out
 
-        project_sections = proj_to_sections.get(project["id"], [])
 
-        for _ in range(num_tasks):
-            created_at = random_datetime_between(project_created, now)
-            section = _pick_section(project_sections) if project_sections else None
-            section_id = section["id"] if section else None
+def _task_rows_in_parallel(
+    workers: int,
+    organization_id: str,
+    projects: List[Dict[str, str]],
+    project_task_ids: List[List[str]],
+    proj_to_sections: Dict[str, List[Dict[str, str]]],
+    team_members: Dict[str, Tuple[str, ...]],
+    all_user_ids: Tuple[str, ...],
+    out: TaskTable,
+) -> Iterator[Tuple[object, ...]]:
+    """
+    Fan projects out across worker processes and yield their rows in order.
 
-            assignee_id = _pick_assignee(project, team_members, all_users)
-
-            # Assign due dates more frequently for roadmap/sprint/launch work.
-            has_due = project["type"] in {"roadmap", "sprint", "launch"}
-            if has_due and random.random() < 0.85:
-                due_date = business_due_date_from_created(created_at, min_days=3, max_days=75)
-            elif random.random() < 0.35:
-                due_date = business_due_date_from_created(created_at, min_days=5, max_days=45)
-            else:
-                due_date = None
-
-            # Completion decisions: globally ~60–70% completed.
-            completed_flag = random.random() < TASK_CONFIG.completion_ratio
-            completed_at = None
-            if completed_flag:
-                completed_at = completed_after_created(created_at, due_date)
-
-            # Introduce a controlled fraction of overdue tasks.
-            if due_date is not None and not completed_flag:
-                # Only some incomplete tasks will truly be overdue.
-                if random.random() < TASK_CONFIG.overdue_task_probability:
-                    # If due_date not yet past, push it slightly into the past.
-                    if due_date >= now.date():
-                        due_date = now.date()
-
-            last_activity_at = completed_at if completed_at else created_at
-
-            name = generate_task_title(
-                faker=faker,
-                project_type=project["type"],
-                section_name=section["name"] if section else None,
+    Projects are dealt round-robin so chunks carry similar task volumes, and
+    worker seeds come from the parent RNG so a seeded run stays reproducible.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _task_rows_for_projects,
+                RNG.getrandbits(32),
+                organization_id,
+                projects[i::workers],
+                project_task_ids[i::workers],
+                {p["id"]: proj_to_sections.get(p["id"], []) for p in projects[i::workers]},
+                team_members,
+                all_user_ids,
             )
+            for i in range(min(workers, len(projects)))
+        ]
+        for future in futures:
+            rows, table = future.result()
+            out.extend(table)
+            yield from rows
 
-            task_id = str(uuid.uuid4())
-
-            rows.append(
-                (
-                    task_id,
-                    project["id"],
-                    section_id,
-                    organization_id,
-                    name,
-                    None,  # description left for future extension
-                    assignee_id,
-                    assignee_id or random.choice(all_users)["id"],  # created_by: mostly assignee or teammate
-                    created_at.isoformat(),
-                    due_date.isoformat() if due_date else None,
-                    completed_at.isoformat() if completed_at else None,
-                    last_activity_at.isoformat(),
-                    random.choice(["low", "medium", "high", "urgent"]),
-                    0,
-                )
-            )
-            tasks.append(
-                {
-                    "id": task_id,
-                    "project_id": project["id"],
-                    "section_id": section_id,
-                    "assignee_id": assignee_id,
-                    "created_at": created_at.isoformat(),
-                    "due_date": due_date.isoformat() if due_date else None,
-                    "completed_at": completed_at.isoformat() if completed_at else None,
-                }
-            )
+
+def generate_tasks(
+    conn,
+    organization_id: str,
+    projects: List[Dict[str, str]],
+    sections: List[Dict[str, str]],
+    users: UserTable,
+    memberships: MembershipTable,
+    faker: Optional[Faker] = None,
+) -> TaskTable:
+    """
+    Create 40–120 tasks per project with corporate-like lifecycle patterns.
+
+    With PARALLEL_CONFIG.task_workers > 1, projects are generated in worker
+    processes and inserted from the parent connection.
+    """
+    proj_to_sections = _sections_by_project(sections)
+    team_members = _build_team_members(projects, memberships)
+    all_user_ids = tuple(users.ids)
+
+    project_task_ids = _allocate_task_ids(projects)
+
+    tasks = TaskTable()
+    workers = PARALLEL_CONFIG.task_workers
+    if workers > 1 and len(projects) > 1:
+        rows = _task_rows_in_parallel(
+            workers, organization_id, projects, project_task_ids, proj_to_sections, team_members, all_user_ids, tasks
+        )
+    else:
+        rows = _iter_task_rows(
+            organization_id, projects, project_task_ids, proj_to_sections, team_members, all_user_ids, tasks
+        )
 
     bulk_insert(
         conn,
@@ -200,6 +389,7 @@ def generate_tasks(
             "is_deleted",
         ],
         rows=rows,
+        multi_row_batch=100,
     )
 
     return tasks
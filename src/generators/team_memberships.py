@@ -8,91 +8,137 @@ structures.
 
 from __future__ import annotations
 
-import random
-import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import re
+from dataclasses import dataclass, field
+from datetime import timedelta
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
 
 from faker import Faker
 
+from ..utils.dates import utc_now
 from ..utils.db import bulk_insert
+from ..utils.ids import new_ids
+from ..utils.rng import RNG
+from ..utils.text import get_faker
+from .teams import TeamTable
+from .users import UserTable
+
+
+# Role keyword -> likely team buckets, checked in priority order. Patterns are
+# plain substring matches on the lower-cased role, like the original keyword
+# checks; the first rule excludes QA so QA engineers fall through to the QA rule.
+_ROLE_TEAM_RULES: Tuple[Tuple[re.Pattern, Tuple[str, ...]], ...] = tuple(
+    (re.compile(pattern), buckets)
+    for pattern, buckets in (
+        (r"^(?!.*qa).*engineer", ("Engineering", "Security", "IT")),
+        (r"qa", ("Quality Assurance", "Engineering")),
+        (r"product", ("Product", "Program Management")),
+        (r"design", ("Design",)),
+        (r"data|analyst", ("Data",)),
+        (r"sales", ("Sales",)),
+        (r"customer success|account", ("Customer Success", "Sales")),
+        (r"security", ("Security", "Engineering")),
+        (r"it", ("IT",)),
+        (r"finance", ("Finance", "Business Operations")),
+        (r"people|recruit", ("People Operations", "Recruiting")),
+        (r"program|project", ("Program Management", "Product")),
+    )
+)
 
 
-def _role_to_preferred_team_names(role: str) -> List[str]:
+def _role_to_preferred_team_names(role: str) -> Tuple[str, ...]:
     """Map user role keywords to likely team buckets."""
     role_lower = role.lower()
-    if "engineer" in role_lower and "qa" not in role_lower:
-        return ["Engineering", "Security", "IT"]
-    if "qa" in role_lower:
-        return ["Quality Assurance", "Engineering"]
-    if "product" in role_lower:
-        return ["Product", "Program Management"]
-    if "design" in role_lower:
-        return ["Design"]
-    if "data" in role_lower or "analyst" in role_lower:
-        return ["Data"]
-    if "sales" in role_lower:
-        return ["Sales"]
-    if "customer success" in role_lower or "account" in role_lower:
-        return ["Customer Success", "Sales"]
-    if "security" in role_lower:
-        return ["Security", "Engineering"]
-    if "it" in role_lower:
-        return ["IT"]
-    if "finance" in role_lower:
-        return ["Finance", "Business Operations"]
-    if "people" in role_lower or "recruit" in role_lower:
-        return ["People Operations", "Recruiting"]
-    if "program" in role_lower or "project" in role_lower:
-        return ["Program Management", "Product"]
-    return ["Business Operations"]
+    for pattern, buckets in _ROLE_TEAM_RULES:
+        if pattern.search(role_lower):
+            return buckets
+    return ("Business Operations",)
+
+
+_MEMBERSHIP_COUNTS = (1, 2, 3)
+_MEMBERSHIP_COUNT_CUM_WEIGHTS = tuple(accumulate((0.7, 0.25, 0.05)))
 
 
 def _pick_membership_count() -> int:
     """
     Users typically belong to a single primary team; a minority straddle two.
     """
-    return random.choices([1, 2, 3], weights=[0.7, 0.25, 0.05], k=1)[0]
+    return RNG.choices(_MEMBERSHIP_COUNTS, cum_weights=_MEMBERSHIP_COUNT_CUM_WEIGHTS, k=1)[0]
+
 
+_MANAGER_TOKENS = ("manager", "lead", "staff")
+_BASE_LEAD_PROBABILITY = 0.07
+# Manager/staff titles lead 70% of the time, and otherwise still get the base
+# chance, so the two draws the old picker made fold into one threshold.
+_MANAGER_LEAD_PROBABILITY = 0.7 + 0.3 * _BASE_LEAD_PROBABILITY
 
-def _pick_membership_role(user_role: str) -> str:
+
+def _lead_probability(user_role: str) -> float:
     """
     Small fraction of memberships are leads, aligning with manager/staff titles.
     """
     role_lower = user_role.lower()
-    is_manager_title = any(token in role_lower for token in ["manager", "lead", "staff"])
-    if is_manager_title and random.random() > 0.3:
-        return "lead"
-    return "lead" if random.random() < 0.07 else "member"
+    if any(token in role_lower for token in _MANAGER_TOKENS):
+        return _MANAGER_LEAD_PROBABILITY
+    return _BASE_LEAD_PROBABILITY
+
+
+@dataclass
+class MembershipTable:
+    """
+    Column-oriented team memberships for the task generator; index i across
+    every list describes the same membership.
+    """
+
+    ids: List[str] = field(default_factory=list)
+    team_ids: List[str] = field(default_factory=list)
+    user_ids: List[str] = field(default_factory=list)
+    roles: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
 
 
 def generate_team_memberships(
     conn,
-    teams: List[Dict[str, str]],
-    users: List[Dict[str, str]],
+    teams: TeamTable,
+    users: UserTable,
     faker: Optional[Faker] = None,
-) -> List[Dict[str, str]]:
+) -> MembershipTable:
     """
     Assign each user to 1–3 teams, steering toward role-aligned teams when present.
 
     We spread added_at dates across the last few years after org formation to
     simulate staggered hiring and team growth.
     """
-    faker = faker or Faker("en_US")
-
-    team_by_name = {t["name"]: t for t in teams}
-    team_ids = [t["id"] for t in teams]
-    rows = []
-    memberships: List[Dict[str, str]] = []
-
-    now = datetime.utcnow()
-    for user in users:
+    faker = faker or get_faker()
+
+    name_to_id = dict(zip(teams.names, teams.ids))
+    team_ids = tuple(teams.ids)
+    # Membership columns are filled directly; IDs are minted in one batch
+    # once the total is known.
+    memberships = MembershipTable()
+    added_isos: List[str] = []
+
+    now = utc_now()
+    day_iso_cache: Dict[int, str] = {}
+    # Candidate team IDs and the lead probability depend only on the role, and
+    # there are far fewer roles than users, so each is computed once per role.
+    role_cache: Dict[str, Tuple[List[str], List[str], float]] = {}
+
+    for user_id, user_role in zip(users.ids, users.roles):
         desired = _pick_membership_count()
-        preferred_names = _role_to_preferred_team_names(user["role"])
 
-        # Build candidate team IDs prioritizing preferred teams.
-        preferred_ids = [team_by_name[name]["id"] for name in preferred_names if name in team_by_name]
-        remaining_ids = [tid for tid in team_ids if tid not in preferred_ids]
+        cached = role_cache.get(user_role)
+        if cached is None:
+            preferred_names = _role_to_preferred_team_names(user_role)
+            # Build candidate team IDs prioritizing preferred teams.
+            preferred_ids = [name_to_id[name] for name in preferred_names if name in name_to_id]
+            preferred_set = set(preferred_ids)
+            remaining_ids = [tid for tid in team_ids if tid not in preferred_set]
+            cached = role_cache[user_role] = (preferred_ids, remaining_ids, _lead_probability(user_role))
+        preferred_ids, remaining_ids, lead_probability = cached
 
         # Guarantee at least one assignment; fill with remaining teams if needed.
         chosen: List[str] = []
@@ -102,33 +148,45 @@ def generate_team_memberships(
             chosen.append(tid)
 
         if len(chosen) < desired:
-            extras = random.sample(remaining_ids, k=min(len(remaining_ids), desired - len(chosen)))
-            chosen.extend(extras)
+            k = min(len(remaining_ids), desired - len(chosen))
+            # Users need at most one or two extra teams almost always; draw
+            # those directly instead of paying random.sample's pool copy.
+            if k == 1:
+                chosen.append(RNG.choice(remaining_ids))
+            elif k == 2:
+                n = len(remaining_ids)
+                i = RNG.randrange(n)
+                j = RNG.randrange(n - 1)
+                chosen.append(remaining_ids[i])
+                chosen.append(remaining_ids[j + 1 if j >= i else j])
+            elif k > 2:
+                chosen.extend(RNG.sample(remaining_ids, k=k))
 
         # If still none (edge case), fallback to any random team.
         if not chosen and team_ids:
-            chosen = [random.choice(team_ids)]
-
-        added_at = now - timedelta(days=random.randint(30, 900))
-        membership_role = _pick_membership_role(user["role"])
-
-        for tid in chosen:
-            membership_id = str(uuid.uuid4())
-            rows.append((membership_id, tid, user["id"], membership_role, added_at.isoformat()))
-            memberships.append(
-                {
-                    "id": membership_id,
-                    "team_id": tid,
-                    "user_id": user["id"],
-                    "role": membership_role,
-                }
-            )
+            chosen = [RNG.choice(team_ids)]
+
+        # Only ~870 distinct day offsets exist, so each ISO string is built once.
+        days_ago = RNG.randint(30, 900)
+        added_iso = day_iso_cache.get(days_ago)
+        if added_iso is None:
+            added_iso = day_iso_cache[days_ago] = (now - timedelta(days=days_ago)).isoformat()
+        membership_role = "lead" if RNG.random() < lead_probability else "member"
+
+        count = len(chosen)
+        memberships.team_ids.extend(chosen)
+        memberships.user_ids.extend([user_id] * count)
+        memberships.roles.extend([membership_role] * count)
+        added_isos.extend([added_iso] * count)
+
+    memberships.ids = new_ids("team_membership", len(memberships.team_ids))
 
+    # Insert rows are zipped lazily from the columns; no second row list.
     bulk_insert(
         conn,
         table="team_memberships",
         columns=["id", "team_id", "user_id", "role", "added_at"],
-        rows=rows,
+        rows=zip(memberships.ids, memberships.team_ids, memberships.user_ids, memberships.roles, added_isos),
     )
 
     return memberships
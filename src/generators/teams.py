@@ -8,8 +8,8 @@ real enterprise org charts.
 
 from __future__ import annotations
 
-import random
-import uuid
+import math
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
@@ -17,38 +17,56 @@ from faker import Faker
 
 from ..utils.config import VOLUME_CONFIG
 from ..utils.db import bulk_insert
+from ..utils.ids import new_ids
+from ..utils.rng import RNG
+from ..utils.text import get_faker
+
+
+@dataclass
+class TeamTable:
+    """
+    Column-oriented team records for the membership and project generators;
+    index i across every list describes the same team.
+    """
+
+    ids: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    created: List[datetime] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
 
 
 def _weighted_unique_sample(options: List[str], weights: List[float], target: int) -> List[str]:
     """
     Sample unique team names using weights (without replacement).
 
-    We retry draws until we reach the requested count to preserve weighting
-    without allowing duplicates.
+    Efraimidis–Spirakis: each option gets the key -ln(U)/w and the `target`
+    smallest keys win. This matches sequential weighted draws without
+    replacement, with no retry loop when heavy options are already taken.
     """
-    chosen = []
-    while len(chosen) < target and len(chosen) < len(options):
-        pick = random.choices(options, weights=weights, k=1)[0]
-        if pick not in chosen:
-            chosen.append(pick)
-    return chosen
+    keyed = sorted(
+        (-math.log(1.0 - RNG.random()) / weight, option)
+        for option, weight in zip(options, weights)
+    )
+    return [option for _, option in keyed[:target]]
 
 
 def generate_teams(
     conn,
     organization: Dict[str, str],
     faker: Optional[Faker] = None,
-) -> List[Dict[str, str]]:
+) -> TeamTable:
     """
     Generate 8–15 teams with realistic functional coverage.
 
     We bias toward ~11 teams using a triangular distribution to emulate
     large-but-not-huge enterprise structures.
     """
-    faker = faker or Faker("en_US")
+    faker = faker or get_faker()
 
     min_t, max_t = VOLUME_CONFIG.min_teams, VOLUME_CONFIG.max_teams
-    target_teams = int(round(random.triangular(min_t, max_t, (min_t + max_t) / 2 + 2)))
+    target_teams = int(round(RNG.triangular(min_t, max_t, (min_t + max_t) / 2 + 2)))
     target_teams = max(min_t, min(max_t, target_teams))
 
     # Core functional areas appear more often; niche teams less so.
@@ -91,21 +109,16 @@ def generate_teams(
 
     # Spread team creation over the last 6–9 years after org founding.
     org_created = datetime.fromisoformat(organization["created_at"])
-    team_records: List[Dict[str, str]] = []
+    teams = TeamTable()
     rows = []
-    for name in picked_names:
-        team_id = str(uuid.uuid4())
-        years_after_org = random.uniform(0.5, 9.0)
+    for name, team_id in zip(picked_names, new_ids("team", len(picked_names))):
+        years_after_org = RNG.uniform(0.5, 9.0)
         created_at = org_created + timedelta(days=365 * years_after_org)
         description = faker.catch_phrase()
         rows.append((team_id, organization["id"], name, description, created_at.isoformat()))
-        team_records.append(
-            {
-                "id": team_id,
-                "name": name,
-                "created_at": created_at.isoformat(),
-            }
-        )
+        teams.ids.append(team_id)
+        teams.names.append(name)
+        teams.created.append(created_at)
 
     bulk_insert(
         conn,
@@ -114,6 +127,6 @@ def generate_teams(
         rows=rows,
     )
 
-    return team_records
+    return teams
 
 
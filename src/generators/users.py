@@ -165,103 +165,149 @@ dates skewed toward recent hires, reflecting ongoing growth.
 
 from __future__ import annotations
 
-import random
-import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import timedelta
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
 
 from faker import Faker
 
 from ..utils.config import ORG_CONFIG, VOLUME_CONFIG
+from ..utils.dates import utc_now
 from ..utils.db import bulk_insert
+from ..utils.ids import new_ids
+from ..utils.rng import RNG
+from ..utils.text import get_faker
 
 
-def _sample_join_date() -> datetime:
+def _sample_join_dates(n: int) -> List[str]:
     """
-    Sample a join date within the last ~3 years, skewed toward recent months.
+    Sample `n` join dates within the last ~3 years, skewed toward recent months.
 
     Beta(2,5) concentrates probability near 0; mapping 0->recent, 1->3 years ago.
+    Returns ISO strings measured from a single `now`.
     """
     span_days = 365 * 3
-    fraction = random.betavariate(2, 5)
-    days_ago = int(fraction * span_days)
-    return datetime.utcnow() - timedelta(days=days_ago)
+    now = utc_now()
+    beta = RNG.betavariate
+    return [(now - timedelta(days=int(beta(2, 5) * span_days))).isoformat() for _ in range(n)]
 
 
-def _pick_role() -> str:
+@dataclass
+class UserTable:
     """
-    Non-uniform role distribution reflecting a product-led enterprise.
+    Column-oriented user records for the membership, task, and comment
+    generators; index i across every list describes the same user.
     """
-    roles = [
-        ("Software Engineer", 0.22),
-        ("Senior Software Engineer", 0.13),
-        ("Staff Engineer", 0.04),
-        ("Product Manager", 0.07),
-        ("Product Owner", 0.03),
-        ("Product Designer", 0.07),
-        ("Design Lead", 0.02),
-        ("Data Scientist", 0.06),
-        ("Data Analyst", 0.04),
-        ("Sales Executive", 0.06),
-        ("Account Manager", 0.05),
-        ("Customer Success Manager", 0.04),
-        ("Sales Engineer", 0.03),
-        ("QA Engineer", 0.04),
-        ("IT Support Specialist", 0.03),
-        ("Security Engineer", 0.02),
-        ("Finance Analyst", 0.02),
-        ("People Ops Specialist", 0.02),
-    ]
-    labels, weights = zip(*roles)
-    return random.choices(labels, weights=weights, k=1)[0]
-
-
-def _pick_location() -> str:
+
+    ids: List[str] = field(default_factory=list)
+    roles: List[str] = field(default_factory=list)
+    locations: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+# Non-uniform role distribution reflecting a product-led enterprise.
+_ROLES = (
+    ("Software Engineer", 0.22),
+    ("Senior Software Engineer", 0.13),
+    ("Staff Engineer", 0.04),
+    ("Product Manager", 0.07),
+    ("Product Owner", 0.03),
+    ("Product Designer", 0.07),
+    ("Design Lead", 0.02),
+    ("Data Scientist", 0.06),
+    ("Data Analyst", 0.04),
+    ("Sales Executive", 0.06),
+    ("Account Manager", 0.05),
+    ("Customer Success Manager", 0.04),
+    ("Sales Engineer", 0.03),
+    ("QA Engineer", 0.04),
+    ("IT Support Specialist", 0.03),
+    ("Security Engineer", 0.02),
+    ("Finance Analyst", 0.02),
+    ("People Ops Specialist", 0.02),
+)
+
+# Weighted office/remote mix to resemble distributed teams.
+_LOCATIONS = (
+    ("New York", 0.18),
+    ("San Francisco", 0.15),
+    ("Austin", 0.10),
+    ("London", 0.12),
+    ("Dublin", 0.08),
+    ("Toronto", 0.07),
+    ("Bangalore", 0.10),
+    ("Remote - US", 0.12),
+    ("Remote - EMEA", 0.05),
+    ("Remote - APAC", 0.03),
+)
+
+# Cumulative weights are computed once so each batched draw skips the
+# running-sum setup random.choices does for plain weights.
+_ROLE_LABELS = tuple(label for label, _ in _ROLES)
+_ROLE_CUM_WEIGHTS = tuple(accumulate(weight for _, weight in _ROLES))
+_LOCATION_LABELS = tuple(label for label, _ in _LOCATIONS)
+_LOCATION_CUM_WEIGHTS = tuple(accumulate(weight for _, weight in _LOCATIONS))
+
+
+def _pick_roles(n: int) -> List[str]:
+    """Draw roles for `n` users in one weighted batch."""
+    return RNG.choices(_ROLE_LABELS, cum_weights=_ROLE_CUM_WEIGHTS, k=n)
+
+
+def _pick_locations(n: int) -> List[str]:
+    """Draw locations for `n` users in one weighted batch."""
+    return RNG.choices(_LOCATION_LABELS, cum_weights=_LOCATION_CUM_WEIGHTS, k=n)
+
+
+def _sample_user_columns(n: int) -> Tuple[List[str], List[str], List[str], List[int]]:
     """
-    Weighted office/remote mix to resemble distributed teams.
+    Draw every non-text attribute for `n` users as whole columns.
+
+    Returns (roles, locations, joined_at ISO strings, is_active flags), one
+    batched draw per column instead of one weighted draw per user per
+    attribute; the caller only zips them with names and IDs.
     """
-    locations = [
-        ("New York", 0.18),
-        ("San Francisco", 0.15),
-        ("Austin", 0.10),
-        ("London", 0.12),
-        ("Dublin", 0.08),
-        ("Toronto", 0.07),
-        ("Bangalore", 0.10),
-        ("Remote - US", 0.12),
-        ("Remote - EMEA", 0.05),
-        ("Remote - APAC", 0.03),
-    ]
-    labels, weights = zip(*locations)
-    return random.choices(labels, weights=weights, k=1)[0]
+    roles = _pick_roles(n)
+    locations = _pick_locations(n)
+    joined_dates = _sample_join_dates(n)
+    rand = RNG.random
+    active_flags = [1 if rand() > 0.03 else 0 for _ in range(n)]  # small inactive fraction
+    return roles, locations, joined_dates, active_flags
 
 
 def generate_users(
     conn,
     organization: Dict[str, str],
     faker: Optional[Faker] = None,
-) -> List[Dict[str, str]]:
+) -> UserTable:
     """
     Generate 3k–8k users with realistic roles and join dates.
 
     Headcount target uses a triangular distribution with mode leaning toward the
     upper half to emulate continued growth.
     """
-    faker = faker or Faker("en_US")
+    faker = faker or get_faker()
 
     min_u, max_u = VOLUME_CONFIG.min_users, VOLUME_CONFIG.max_users
     mode = (min_u + max_u) / 2 + 800
-    total_users = int(round(random.triangular(min_u, max_u, mode)))
+    total_users = int(round(RNG.triangular(min_u, max_u, mode)))
     total_users = max(min_u, min(max_u, total_users))
 
     used_emails = set()
+    domain = ORG_CONFIG.domain
+    organization_id = organization["id"]
     rows = []
-    users: List[Dict[str, str]] = []
 
-    for _ in range(total_users):
+    user_ids = new_ids("user", total_users)
+    roles, locations, joined_dates, active_flags = _sample_user_columns(total_users)
+
+    for user_id, role, location, joined_iso, is_active in zip(
+        user_ids, roles, locations, joined_dates, active_flags
+    ):
         full_name = faker.name()
-        first = full_name.split(" ")[0]
-        last = full_name.split(" ")[-1]
 
         # base_email = (
         #     f"{first}.{last}"
@@ -279,35 +325,23 @@ def generate_users(
         # used_emails.add(email)
        
 
-        role = _pick_role()
-        location = _pick_location()
-        joined_at = _sample_join_date()
-        is_active = 1 if random.random() > 0.03 else 0  # small inactive fraction
-
-        user_id = str(uuid.uuid4())
-        email = f"user-{uuid.uuid4().hex[:8]}@{ORG_CONFIG.domain}"
+        # Reuse the user ID's tail rather than minting a second random value;
+        # the tail (not the head) stays unique for sequential IDs too.
+        email = f"user-{user_id[-8:]}@{domain}"
         rows.append(
             (
                 user_id,
-                organization["id"],
+                organization_id,
                 full_name,
                 email,
                 role,
                 location,
-                joined_at.isoformat(),
+                joined_iso,
                 is_active,
-                joined_at.isoformat(),
+                joined_iso,
             )
         )
 
-        users.append(
-            {
-                "id": user_id,
-                "role": role,
-                "location": location,
-            }
-        )
-
     bulk_insert(
         conn,
         table="users",
@@ -325,4 +359,4 @@ def generate_users(
         rows=rows,
     )
 
-    return users
+    return UserTable(ids=user_ids, roles=roles, locations=locations)
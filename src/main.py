@@ -6,8 +6,6 @@ Orchestration only: all generation logic lives in dedicated modules.
 
 from __future__ import annotations
 
-from faker import Faker
-
 # from utils.db import apply_schema, db_session
 # from generators.organizations import generate_organization
 # from generators.teams import generate_teams
@@ -19,7 +17,8 @@ from faker import Faker
 # from generators.subtasks import generate_subtasks
 # from generators.comments import generate_comments
 
-from src.utils.db import apply_schema, db_session
+from src.utils.db import apply_schema, db_session, finalize_schema
+from src.utils.text import get_faker
 from src.generators.organizations import generate_organization
 from src.generators.teams import generate_teams
 from src.generators.users import generate_users
@@ -38,9 +37,10 @@ def run() -> None:
     1) organization -> 2) teams -> 3) users -> 4) team memberships
     5) projects -> 6) sections -> 7) tasks -> 8) subtasks -> 9) comments
 
-    Each step passes IDs forward to preserve referential integrity.
+    Each step passes IDs forward to preserve referential integrity; indexes
+    and the foreign key check run once at the end.
     """
-    faker = Faker("en_US")
+    faker = get_faker()
 
     with db_session() as conn:
         apply_schema(conn)
@@ -73,6 +73,8 @@ def run() -> None:
             faker=faker,
         )
 
+        finalize_schema(conn)
+
 
 if __name__ == "__main__":
     run()
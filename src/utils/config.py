@@ -7,6 +7,7 @@ All numeric volumes and distribution weights live here so that:
 """
 
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -57,12 +58,61 @@ class TaskConfig:
 class DBConfig:
     # Relative path for the SQLite file produced by the generator
     output_path: str = "asana-seed-data/output/asana_simulation.sqlite"
-    schema_path: str = "asana-seed-data/schema.sql"
+    # Schema files, relative to the repository root: tables are created before
+    # the load, indexes are built after it (see db.finalize_schema).
+    schema_tables_path: str = "schema_tables.sql"
+    schema_indexes_path: str = "schema_indexes.sql"
+
+    # Bulk-load PRAGMAs. The output file is disposable, so durability is
+    # traded for speed; use synchronous="NORMAL" to keep a WAL-safe fsync.
+    page_size: int = 8192
+    journal_mode: str = "WAL"
+    synchronous: str = "OFF"
+    cache_size_kib: int = 262144
+    mmap_size: int = 268435456
+
+
+@dataclass(frozen=True)
+class IdConfig:
+    # UUID strings mirror Asana API IDs. Sequential IDs ("task-00000001") are
+    # cheaper to mint and easier to read when debugging; opt in only when
+    # consumers don't rely on the UUID format.
+    sequential_ids: bool = False
+
+
+@dataclass(frozen=True)
+class ParallelConfig:
+    # Worker processes for per-project task generation. Projects are
+    # independent until insert time, so large runs can fan out; 1 keeps
+    # generation in-process, which is faster for the default volumes.
+    task_workers: int = 1
+
+
+@dataclass(frozen=True)
+class FakerConfig:
+    # One shared Faker instance serves every generator; it is seeded from
+    # RandomConfig.seed so names and sentences follow the same knob.
+    locale: str = "en_US"
+
+
+@dataclass(frozen=True)
+class RandomConfig:
+    # Seed for the shared random source (utils.rng.RNG), the Faker instance,
+    # and UUID minting. None draws fresh OS entropy each run. With a seed,
+    # every value is fixed except timestamps, which are measured from the
+    # run's "now"; pin reference_time (ISO 8601, UTC) as well to reproduce a
+    # dataset exactly.
+    seed: Optional[int] = None
+    reference_time: Optional[str] = None
 
 
 ORG_CONFIG = OrgConfig()
 VOLUME_CONFIG = VolumeConfig()
 TASK_CONFIG = TaskConfig()
 DB_CONFIG = DBConfig()
+ID_CONFIG = IdConfig()
+PARALLEL_CONFIG = ParallelConfig()
+FAKER_CONFIG = FakerConfig()
+RANDOM_CONFIG = RandomConfig()
 
 
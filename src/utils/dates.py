@@ -10,8 +10,28 @@ Key goals:
 from __future__ import annotations
 
 import calendar
-import random
 from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from .config import RANDOM_CONFIG
+from .rng import RNG
+
+_NOW: Optional[datetime] = None
+
+
+def utc_now() -> datetime:
+    """
+    The run's "now": RandomConfig.reference_time if set, otherwise the wall
+    clock read once on first use, so every generator measures from the same
+    instant.
+    """
+    global _NOW
+    if _NOW is None:
+        if RANDOM_CONFIG.reference_time is not None:
+            _NOW = datetime.fromisoformat(RANDOM_CONFIG.reference_time)
+        else:
+            _NOW = datetime.utcnow()
+    return _NOW
 
 
 def random_datetime_between(start: datetime, end: datetime) -> datetime:
@@ -24,11 +44,27 @@ def random_datetime_between(start: datetime, end: datetime) -> datetime:
     if start >= end:
         return start
     total_seconds = (end - start).total_seconds()
-    frac = random.betavariate(2, 5)
+    frac = RNG.betavariate(2, 5)
     offset = total_seconds * (1 - frac)
     return start + timedelta(seconds=offset)
 
 
+def random_datetimes_between(start: datetime, end: datetime, n: int) -> List[datetime]:
+    """
+    Sample `n` datetimes between start and end in ascending order.
+
+    Same Beta(2, 5) skew toward `end` as `random_datetime_between`, but the
+    interval is measured once and the draws are sorted so callers get an
+    ordered activity stream (e.g., a comment thread) from one batch.
+    """
+    if start >= end:
+        return [start] * n
+    total_seconds = (end - start).total_seconds()
+    betavariate = RNG.betavariate
+    offsets = sorted(total_seconds * (1 - betavariate(2, 5)) for _ in range(n))
+    return [start + timedelta(seconds=offset) for offset in offsets]
+
+
 def _to_business_day(d: date) -> date:
     """
     Snap a date to the closest weekday.
@@ -40,7 +76,7 @@ def _to_business_day(d: date) -> date:
         return d
     # Saturday (5) -> Friday or Monday; Sunday (6) -> Monday
     if weekday == 5:
-        return d - timedelta(days=1) if random.random() < 0.6 else d + timedelta(days=2)
+        return d - timedelta(days=1) if RNG.random() < 0.6 else d + timedelta(days=2)
     return d + timedelta(days=1)
 
 
@@ -58,7 +94,7 @@ def business_due_date_from_created(
     if max_days <= 0:
         return _to_business_day(created_at.date())
     mode = min_days + (max_days - min_days) * 0.35
-    offset_days = int(round(random.triangular(min_days, max_days, mode)))
+    offset_days = int(round(RNG.triangular(min_days, max_days, mode)))
     offset_days = max(min_days, min(max_days, offset_days))
     raw_date = created_at.date() + timedelta(days=offset_days)
     return _to_business_day(raw_date)
@@ -96,7 +132,7 @@ def is_overdue(due: date | None, completed_at: datetime | None, now: datetime |
     """
     if due is None:
         return False
-    now = now or datetime.utcnow()
+    now = now or utc_now()
     if completed_at is not None:
         return False
     return due < now.date()
@@ -2,8 +2,9 @@
 Database utilities for the Asana-like SQLite simulation.
 
 This module centralizes:
-- Opening a connection with foreign key enforcement.
-- Applying the schema from schema.sql.
+- Opening a connection tuned for bulk loading.
+- Applying the schema: tables before the load, indexes and the foreign key
+  check after it.
 - Simple, explicit helpers for bulk inserts that avoid ORMs.
 
 We keep the abstraction thin so that generated SQL remains transparent for
@@ -12,11 +13,13 @@ debugging and for AI agents that may inspect queries.
 
 from __future__ import annotations
 
+import functools
 import os
 import sqlite3
 from contextlib import contextmanager
+from itertools import chain, islice
 from pathlib import Path
-from typing import Iterable, List, Mapping, Sequence, Tuple
+from typing import Iterable, Iterator, List, Mapping, Sequence, Tuple
 
 from .config import DB_CONFIG
 
@@ -25,6 +28,21 @@ from pathlib import Path
 # BASE_DIR = Path(__file__).resolve().parent.parent.parent
 # SCHEMA_PATH = BASE_DIR / "schema.sql"
 
+# The generator is the only writer and the output file is disposable, so we
+# trade crash durability for load speed: WAL appends, no fsync, an exclusive
+# lock, and a large page cache keep bulk inserts CPU-bound instead of I/O-bound.
+# Values live in DBConfig so a run can opt back into safer settings.
+# page_size must come first: it only takes effect on a fresh file, before
+# journal_mode=WAL fixes the page layout.
+_BULK_LOAD_PRAGMAS = f"""
+PRAGMA page_size = {DB_CONFIG.page_size};
+PRAGMA journal_mode = {DB_CONFIG.journal_mode};
+PRAGMA synchronous = {DB_CONFIG.synchronous};
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -{DB_CONFIG.cache_size_kib};
+PRAGMA locking_mode = EXCLUSIVE;
+PRAGMA mmap_size = {DB_CONFIG.mmap_size};
+"""
 
 
 def _ensure_parent_dir(path: Path) -> None:
@@ -35,11 +53,15 @@ def _ensure_parent_dir(path: Path) -> None:
 
 def get_connection(db_path: str | None = None) -> sqlite3.Connection:
     """
-    Create a SQLite connection with foreign keys enabled.
+    Create a SQLite connection tuned for bulk loading.
 
     We default to the configured output path so callers don't need to know
-    filesystem layout. Using row_factory=sqlite3.Row keeps rows dict-like,
-    which makes bulk loading and debugging easier.
+    filesystem layout. The connection only writes, so rows keep the default
+    tuple factory; readers that want sqlite3.Row can set it locally.
+
+    The connection is opened with isolation_level=None so the driver never
+    issues implicit BEGINs; transactions are opened explicitly via
+    `transaction`.
     """
     if db_path is None:
         db_path = DB_CONFIG.output_path
@@ -47,50 +69,155 @@ def get_connection(db_path: str | None = None) -> sqlite3.Connection:
     path = Path(db_path)
     _ensure_parent_dir(path)
 
-    conn = sqlite3.connect(str(path))
-    conn.row_factory = sqlite3.Row
+    conn = sqlite3.connect(str(path), isolation_level=None)
 
-    # Enforce referential integrity; this is off by default in SQLite.
-    conn.execute("PRAGMA foreign_keys = ON;")
+    # Generators insert in dependency order, so per-row foreign key lookups
+    # only slow the load; finalize_schema verifies integrity once at the end.
+    conn.execute("PRAGMA foreign_keys = OFF;")
+    conn.executescript(_BULK_LOAD_PRAGMAS)
     return conn
 
 
 
+_BASE_DIR = Path(__file__).resolve().parent.parent.parent
+_SCHEMA_TABLES_PATH = _BASE_DIR / DB_CONFIG.schema_tables_path
+_SCHEMA_INDEXES_PATH = _BASE_DIR / DB_CONFIG.schema_indexes_path
+
+
+def _run_sql_file(conn: sqlite3.Connection, path: Path) -> None:
+    if not path.exists():
+        raise FileNotFoundError(f"Schema file not found at {path}")
+
+    with open(path, "r", encoding="utf-8") as f:
+        script = f.read()
+
+    # executescript runs in autocommit mode, so each DDL statement would be
+    # its own transaction; wrap the file so it applies with one commit.
+    conn.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+
+
 def apply_schema(conn):
-    BASE_DIR = Path(__file__).resolve().parent.parent.parent
-    SCHEMA_PATH = BASE_DIR / "schema.sql"
+    """Create the tables. Indexes are deferred to finalize_schema."""
+    _run_sql_file(conn, _SCHEMA_TABLES_PATH)
+
+
+def finalize_schema(conn: sqlite3.Connection) -> None:
+    """
+    Build indexes and verify referential integrity after the bulk load.
+
+    Creating indexes over already-loaded tables is a single sorted build per
+    index rather than an incremental B-tree update per insert. Foreign keys
+    are not enforced while loading, so one foreign_key_check replaces the
+    per-row lookups.
+    """
+    _run_sql_file(conn, _SCHEMA_INDEXES_PATH)
+
+    violations = conn.execute("PRAGMA foreign_key_check;").fetchall()
+    if violations:
+        table, rowid, parent, _ = violations[0]
+        raise sqlite3.IntegrityError(
+            f"{len(violations)} foreign key violation(s); first: {table} rowid {rowid} -> {parent}"
+        )
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Run the block in one BEGIN IMMEDIATE ... COMMIT, rolling back on error.
+
+    If a transaction is already open, the block joins it and the outer
+    owner commits, so helpers like bulk_insert can nest inside a wider one.
+    """
+    if conn.in_transaction:
+        yield conn
+        return
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
 
-    if not SCHEMA_PATH.exists():
-        raise FileNotFoundError(f"Schema file not found at {SCHEMA_PATH}")
 
-    with open(SCHEMA_PATH, "r", encoding="utf-8") as f:
-        conn.executescript(f.read())
+# Rows per executemany call inside a bulk_insert transaction.
+_INSERT_CHUNK_ROWS = 10_000
 
-    conn.commit()
+# SQLite's compile-time default for bound parameters per statement before
+# 3.32; used when the connection cannot report its own limit.
+_DEFAULT_MAX_VARIABLES = 999
 
 
+def _max_variables(conn: sqlite3.Connection) -> int:
+    """
+    Bound-parameter limit for `conn` (Connection.getlimit needs Python 3.11+).
+    """
+    getlimit = getattr(conn, "getlimit", None)
+    if getlimit is None:
+        return _DEFAULT_MAX_VARIABLES
+    return getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+
+
+@functools.lru_cache(maxsize=32)
+def _insert_sql(table: str, columns: Tuple[str, ...], rows_per_statement: int = 1) -> str:
+    """
+    Build (once per table/column/row-count signature) the INSERT used by bulk_insert.
+
+    The connection's statement cache is keyed by SQL text, so repeat calls
+    with the same signature reuse the already-prepared statement.
+    """
+    cols_sql = ", ".join(columns)
+    placeholders = "(" + ", ".join(["?"] * len(columns)) + ")"
+    values_sql = ", ".join([placeholders] * rows_per_statement)
+    return f"INSERT INTO {table} ({cols_sql}) VALUES {values_sql}"
+
 
 def bulk_insert(
     conn: sqlite3.Connection,
     table: str,
     columns: Sequence[str],
     rows: Iterable[Sequence[object]],
+    multi_row_batch: int = 0,
 ) -> None:
     """
     Perform an efficient bulk insert into a given table.
 
     We avoid clever abstractions here; explicit column lists make it easy to
     reason about the generated SQL and keep the mapping stable for AI agents.
-    """
-    if not rows:
-        return
 
-    cols_sql = ", ".join(columns)
-    placeholders = ", ".join(["?"] * len(columns))
-    sql = f"INSERT INTO {table} ({cols_sql}) VALUES ({placeholders})"
+    Each call runs inside `transaction`: one BEGIN IMMEDIATE ... COMMIT, or
+    the caller's transaction if one is already open. Rows are fed to
+    executemany in fixed-size chunks, so `rows` may be a generator and memory
+    stays bounded for very large tables.
 
-    conn.executemany(sql, list(rows))
-    conn.commit()
+    With multi_row_batch > 1, full groups of that many rows go through one
+    multi-row `VALUES (...), (...)` statement, so SQLite runs one statement
+    per group rather than per row; leftover rows use the single-row INSERT.
+    The group size is clamped so each statement stays within the
+    connection's bound-parameter limit.
+    """
+    multi_row_batch = min(multi_row_batch, _max_variables(conn) // len(columns))
+    sql = _insert_sql(table, tuple(columns))
+    multi_sql = _insert_sql(table, tuple(columns), multi_row_batch) if multi_row_batch > 1 else None
+    rows = iter(rows)
+
+    with transaction(conn):
+        while True:
+            chunk = list(islice(rows, _INSERT_CHUNK_ROWS))
+            if not chunk:
+                break
+            if multi_sql is not None:
+                full = len(chunk) - len(chunk) % multi_row_batch
+                conn.executemany(
+                    multi_sql,
+                    (
+                        tuple(chain.from_iterable(chunk[i:i + multi_row_batch]))
+                        for i in range(0, full, multi_row_batch)
+                    ),
+                )
+                chunk = chunk[full:]
+            conn.executemany(sql, chunk)
 
 
 @contextmanager
@@ -102,6 +229,7 @@ def db_session(db_path: str | None = None) -> sqlite3.Connection:
         with db_session() as conn:
             apply_schema(conn)
             ...
+            finalize_schema(conn)
     """
     conn = get_connection(db_path)
     try:
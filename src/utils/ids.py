@@ -0,0 +1,74 @@
+"""
+Identifier helpers for the Asana-like data generator.
+
+Generators create tens of thousands of rows, so we mint primary keys in
+batches: one os.urandom call per batch instead of one uuid.UUID object per
+row. The output is still a standard random (version 4) UUID string, unless
+IdConfig.sequential_ids switches to per-kind counters. When RandomConfig.seed
+is set, the bytes come from the shared RNG so IDs repeat between runs.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Dict, List
+
+from .config import ID_CONFIG, RANDOM_CONFIG
+from .rng import RNG
+
+# RFC 4122 variant nibble: the top two bits of byte 8 must be 0b10.
+_VARIANT_NIBBLES = "89ab"
+
+
+def bulk_uuids(n: int) -> List[str]:
+    """
+    Return `n` random version-4 UUID strings drawn from a single byte buffer
+    (os.urandom, or the seeded RNG for reproducible runs).
+
+    Each 16-byte slice is hex-formatted once; the version and variant nibbles
+    are patched in the string to match `str(uuid.uuid4())`.
+    """
+    if n <= 0:
+        return []
+    if RANDOM_CONFIG.seed is None:
+        raw = os.urandom(16 * n).hex()
+    else:
+        raw = RNG.randbytes(16 * n).hex()
+    ids = []
+    for start in range(0, 32 * n, 32):
+        h = raw[start:start + 32]
+        variant = _VARIANT_NIBBLES[int(h[16], 16) & 0x3]
+        ids.append(f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}")
+    return ids
+
+
+class IdFactory:
+    """
+    Sequential, kind-prefixed IDs (e.g., "task-00000001").
+
+    Counters are per kind and per process, so a single factory must mint
+    every ID of a given kind for a run.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, int] = {}
+
+    def next(self, kind: str) -> str:
+        return self.batch(kind, 1)[0]
+
+    def batch(self, kind: str, n: int) -> List[str]:
+        start = self._counters.get(kind, 0)
+        self._counters[kind] = start + max(n, 0)
+        return [f"{kind}-{i:08d}" for i in range(start + 1, start + n + 1)]
+
+
+_ID_FACTORY = IdFactory()
+
+
+def new_ids(kind: str, n: int) -> List[str]:
+    """
+    Mint `n` primary keys for rows of `kind` using the configured ID scheme.
+    """
+    if ID_CONFIG.sequential_ids:
+        return _ID_FACTORY.batch(kind, n)
+    return bulk_uuids(n)
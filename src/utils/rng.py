@@ -0,0 +1,17 @@
+"""
+Shared random source for the Asana-like data generator.
+
+Every generator draws from this one random.Random instead of the random
+module's hidden global instance, so setting RandomConfig.seed fixes every
+random draw in a run, including Faker text and UUIDs; timestamps also need
+RandomConfig.reference_time. Task worker processes reseed it from the
+per-worker seed drawn in the parent.
+"""
+
+from __future__ import annotations
+
+import random
+
+from .config import RANDOM_CONFIG
+
+RNG = random.Random(RANDOM_CONFIG.seed)
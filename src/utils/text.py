@@ -7,13 +7,25 @@ encode intent, scope, and sometimes the workflow stage.
 
 from __future__ import annotations
 
-import random
-from typing import Optional
+import sys
+import weakref
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 
-from faker import Faker
+from .config import FAKER_CONFIG, RANDOM_CONFIG
+from .rng import RNG
 
+if TYPE_CHECKING:
+    from faker import Faker
 
-_VERBS = [
+# Title and comment helpers run once per generated row; bind the shared RNG's
+# methods once so each call skips the attribute lookup.
+_choice = RNG.choice
+_choices = RNG.choices
+_rand = RNG.random
+_randint = RNG.randint
+
+
+_VERBS = (
     "Review",
     "Implement",
     "Draft",
@@ -28,33 +40,40 @@ _VERBS = [
     "Migrate",
     "Clean up",
     "Backfill",
-]
+)
 
-_OBJECTS_PRODUCT = [
+_OBJECTS_PRODUCT = (
     "API contract for {area}",
     "feature spec for {area}",
     "user journey for {area}",
     "acceptance criteria for {area}",
     "tracking plan for {area}",
-]
+)
 
-_OBJECTS_ENGINEERING = [
+_OBJECTS_ENGINEERING = (
     "service dependency graph",
     "background job reliability",
     "database query performance",
     "error handling for edge cases",
     "deployment pipeline",
-]
+)
 
-_OBJECTS_GO_TO_MARKET = [
+_OBJECTS_OPS = (
+    "runbook for {area} incidents",
+    "alert thresholds for {area}",
+    "playbook for {area} handoffs",
+    "cleanup tasks for {area}",
+)
+
+_OBJECTS_GO_TO_MARKET = (
     "launch messaging",
     "sales enablement deck",
     "onboarding guide",
     "pricing one-pager",
     "FAQ document",
-]
+)
 
-_AREAS = [
+_AREAS = (
     "billing",
     "onboarding",
     "notifications",
@@ -62,11 +81,145 @@ _AREAS = [
     "mobile experience",
     "reporting dashboards",
     "admin controls",
-]
+)
+
+# Merged object pools per project type, concatenated once at import.
+_OBJECTS_ROADMAP_LAUNCH = _OBJECTS_PRODUCT + _OBJECTS_GO_TO_MARKET
+_OBJECTS_SPRINT = _OBJECTS_ENGINEERING + _OBJECTS_PRODUCT
+
+
+_LAUNCH_QUALIFIERS = (
+    "Smart",
+    "Unified",
+    "Self-Serve",
+    "Real-Time",
+    "Guided",
+    "Automated",
+    "Collaborative",
+    "Next-Gen",
+)
+
+_LAUNCH_FEATURES = (
+    "Billing",
+    "Onboarding",
+    "Reporting",
+    "Workflows",
+    "Notifications",
+    "Permissions",
+    "Search",
+    "Integrations",
+    "Analytics",
+    "Approvals",
+)
+
+_PROJECT_DESCRIPTIONS = {
+    "roadmap": (
+        "Quarterly priorities and milestones for {team}.",
+        "Planned initiatives and sequencing for {team} this cycle.",
+        "Roadmap commitments {team} is tracking with stakeholders.",
+    ),
+    "sprint": (
+        "Sprint backlog and in-flight work for {team}.",
+        "Committed stories and bug fixes for this iteration.",
+        "Delivery scope agreed in sprint planning.",
+    ),
+    "launch": (
+        "Cross-functional launch checklist and owners.",
+        "Go-to-market tasks, approvals, and launch readiness.",
+        "Everything needed to ship and announce the release.",
+    ),
+    "ops": (
+        "Recurring operational work and maintenance for {team}.",
+        "Reliability, hygiene, and process upkeep tasks.",
+        "Ongoing requests and upkeep owned by {team}.",
+    ),
+}
+
+
+_FAKER: Optional[Faker] = None
+
+
+def get_faker() -> Faker:
+    """
+    Return the shared Faker instance, creating it on first use.
+
+    Building a Faker loads its locale providers, so generators share one
+    instance instead of each constructing their own. Faker itself is imported
+    here, so title-only callers never pay its import cost.
+    """
+    global _FAKER
+    if _FAKER is None:
+        from faker import Faker
+
+        _FAKER = Faker(FAKER_CONFIG.locale)
+        if RANDOM_CONFIG.seed is not None:
+            _FAKER.seed_instance(RANDOM_CONFIG.seed)
+    return _FAKER
+
+
+def generate_launch_feature() -> str:
+    """
+    Product-style feature label for launch projects (e.g., "Unified Billing").
+    """
+    return f"{_choice(_LAUNCH_QUALIFIERS)} {_choice(_LAUNCH_FEATURES)}"
+
+
+def generate_project_description(project_type: str, team_name: str) -> str:
+    """
+    One-line project description matched to the project type.
+
+    Static templates replace per-project Faker lorem sentences: they read
+    like real board descriptions and cost a single random pick.
+    """
+    templates = _PROJECT_DESCRIPTIONS.get(project_type, _PROJECT_DESCRIPTIONS["ops"])
+    return _choice(templates).format(team=team_name)
 
 
-def _pick_area() -> str:
-    return random.choice(_AREAS)
+def _title_table(objects: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Every (verb, object, area) title for an object pool, fully formatted.
+
+    Enumerating the full product keeps the original uniform odds per verb,
+    object, and area, while each title costs a single random.choice instead
+    of three picks plus str.format. Tables stay around 1k strings; entries
+    are interned so every row with the same title shares one object.
+    """
+    return tuple(
+        sys.intern(f"{verb} {obj.format(area=area)}")
+        for verb in _VERBS
+        for obj in objects
+        for area in _AREAS
+    )
+
+
+# Built eagerly at import (a few thousand short strings); unknown project
+# types fall back to the ops table, as the old if/else chain did.
+_OPS_TITLES = _title_table(_OBJECTS_OPS)
+_ROADMAP_LAUNCH_TITLES = _title_table(_OBJECTS_ROADMAP_LAUNCH)
+_TITLE_TABLES = {
+    "roadmap": _ROADMAP_LAUNCH_TITLES,
+    "launch": _ROADMAP_LAUNCH_TITLES,
+    "sprint": _title_table(_OBJECTS_SPRINT),
+    "ops": _OPS_TITLES,
+}
+
+# Backlog titles reuse one prebuilt "Candidate: ..." string per table entry
+# instead of formatting a fresh copy for every backlog task.
+_CANDIDATE_TITLES = {
+    title: sys.intern(f"Candidate: {title}")
+    for table in _TITLE_TABLES.values()
+    for title in table
+}
+
+
+_BACKLOG_SECTIONS = frozenset({"backlog", "ideas"})
+# Both backlog names start with b/i; other sections are rejected on their
+# first character without building a lowercased copy.
+_BACKLOG_INITIALS = frozenset("bBiI")
+
+
+def _is_backlog_section(section_name: str) -> bool:
+    return section_name[0] in _BACKLOG_INITIALS and section_name.lower() in _BACKLOG_SECTIONS
 
 
 def generate_task_title(
@@ -82,50 +235,75 @@ def generate_task_title(
     - sprint work leans toward implementation and bug fixing.
     - ops work leans toward reliability, runbooks, and cleanups.
     """
-    verb = random.choice(_VERBS)
-    area = _pick_area()
+    return generate_task_titles(project_type, (section_name,))[0]
 
-    if project_type in {"roadmap", "launch"}:
-        obj = random.choice(_OBJECTS_PRODUCT + _OBJECTS_GO_TO_MARKET)
-    elif project_type == "sprint":
-        obj = random.choice(_OBJECTS_ENGINEERING + _OBJECTS_PRODUCT)
-    else:  # ops
-        obj = random.choice(
-            [
-                "runbook for {area} incidents",
-                "alert thresholds for {area}",
-                "playbook for {area} handoffs",
-                "cleanup tasks for {area}",
-            ]
-        )
 
-    phrase = f"{verb} " + obj.format(area=area)
+def generate_task_titles(project_type: str, section_names: Sequence[Optional[str]]) -> List[str]:
+    """
+    Bulk form of generate_task_title: one title per entry in `section_names`.
 
-    if section_name and section_name.lower() in {"backlog", "ideas"} and random.random() < 0.4:
-        phrase = "Candidate: " + phrase
-    return phrase
+    All titles for a project come from one RNG.choices draw over its title
+    table; only backlog/ideas sections take the extra "Candidate:" draw.
+    """
+    titles = _choices(_TITLE_TABLES.get(project_type, _OPS_TITLES), k=len(section_names))
+    # A project has only a handful of sections, so each name is lowercased and
+    # classified once per call rather than once per task.
+    is_backlog: Dict[str, bool] = {}
+    for i, section_name in enumerate(section_names):
+        if not section_name:
+            continue
+        backlog = is_backlog.get(section_name)
+        if backlog is None:
+            backlog = is_backlog[section_name] = _is_backlog_section(section_name)
+        if backlog and _rand() < 0.4:
+            titles[i] = _CANDIDATE_TITLES[titles[i]]
+    return titles
+
+
+_SUBTASK_PREFIXES = (
+    "Draft",
+    "Review",
+    "Finalize",
+    "Get sign-off on",
+    "Update",
+    "Double-check",
+    "Clarify",
+)
 
 
 def generate_subtask_title(parent_title: str) -> str:
     """
     Short, action-oriented subtask titles derived from the parent.
     """
-    prefixes = [
-        "Draft",
-        "Review",
-        "Finalize",
-        "Get sign-off on",
-        "Update",
-        "Double-check",
-        "Clarify",
-    ]
-    prefix = random.choice(prefixes)
     # Keep only a short suffix from parent to avoid overly long titles.
-    focus = parent_title.split(" for ")[-1]
-    return f"{prefix} {focus}"
+    # rfind + slice takes the text after the last " for " without building
+    # the full split list.
+    idx = parent_title.rfind(" for ")
+    focus = parent_title[idx + 5:] if idx != -1 else parent_title
+    return f"{_choice(_SUBTASK_PREFIXES)} {focus}"
 
 
-_COMMENT_SNIPPETS = [
+def generate_subtask_titles(parent_titles: Sequence[str]) -> List[str]:
+    """
+    Bulk form of generate_subtask_title: one title per entry in `parent_titles`.
+
+    Prefixes for the whole batch come from a single RNG.choices draw, and each
+    distinct parent's focus is sliced out once. Titles are interned, since a
+    parent's subtasks repeat the same few prefix/focus pairs.
+    """
+    prefixes = _choices(_SUBTASK_PREFIXES, k=len(parent_titles))
+    focus_of: Dict[str, str] = {}
+    titles = []
+    for prefix, parent_title in zip(prefixes, parent_titles):
+        focus = focus_of.get(parent_title)
+        if focus is None:
+            idx = parent_title.rfind(" for ")
+            focus = focus_of[parent_title] = parent_title[idx + 5:] if idx != -1 else parent_title
+        titles.append(sys.intern(f"{prefix} {focus}"))
+    return titles
+
+
+_COMMENT_SNIPPETS = (
     "Let’s sync on this before EOD.",
     "Pushing this to next sprint based on priorities.",
     "Blocked until we hear back from legal.",
@@ -136,16 +314,48 @@ _COMMENT_SNIPPETS = [
     "Happy to pair on this if helpful.",
     "Let’s keep this aligned with the roadmap doc.",
     "Moving this to In Progress now.",
-]
+)
+
+
+# Faker's sentence provider carries noticeable per-call overhead; comment
+# bodies draw from a pool filled 512 sentences at a time and refilled lazily.
+# Pools are kept per Faker instance, so a caller passing its own instance
+# (another locale or seed) only ever gets that instance's sentences.
+_FAKER_SENTENCE_POOL_SIZE = 512
+_FAKER_SENTENCES: "weakref.WeakKeyDictionary[Faker, List[str]]" = weakref.WeakKeyDictionary()
+
+
+def _faker_sentence(faker: Faker) -> str:
+    """
+    Pop one short sentence (6-14 words) from `faker`'s pool, refilling it
+    when empty.
+    """
+    pool = _FAKER_SENTENCES.get(faker)
+    if pool is None:
+        pool = _FAKER_SENTENCES[faker] = []
+    if not pool:
+        # Faker resolves providers through __getattr__; look the method up once.
+        sentence = faker.sentence
+        pool.extend(sentence(nb_words=_randint(6, 14)) for _ in range(_FAKER_SENTENCE_POOL_SIZE))
+    return pool.pop()
 
 
 def generate_comment(faker: Faker) -> str:
     """
     Short, conversational comment that reads like internal async communication.
     """
-    if random.random() < 0.7:
-        return random.choice(_COMMENT_SNIPPETS)
-    # Occasionally fall back to a very short Faker sentence for variety.
-    return faker.sentence(nb_words=random.randint(6, 14))
+    return generate_comment_bodies(faker, 1)[0]
 
 
+def generate_comment_bodies(faker: Faker, n: int) -> List[str]:
+    """
+    Bulk form of generate_comment: `n` comment bodies.
+
+    Snippets for every slot come from one RNG.choices draw; ~30% of slots are
+    then swapped for a very short Faker sentence for variety.
+    """
+    bodies = _choices(_COMMENT_SNIPPETS, k=n)
+    for i in range(n):
+        if _rand() >= 0.7:
+            bodies[i] = _faker_sentence(faker)
+    return bodies